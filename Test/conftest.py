@@ -0,0 +1,15 @@
+"""Shared fixtures for the xl_borders test suite."""
+
+import pytest
+from openpyxl.styles import Side
+
+
+@pytest.fixture(scope="session")
+def palette():
+    """Colored Side objects built once and shared read-only across tests."""
+    return {
+        "thin_red": Side(style="thin", color="FF0000"),
+        "thick_red": Side(style="thick", color="FF0000"),
+        "dashed_red": Side(style="dashed", color="FF0000"),
+        "double_green": Side(style="double", color="00FF00"),
+    }
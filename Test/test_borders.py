@@ -1,379 +1,440 @@
 """Tests for xl_borders.borders module."""
 
-import pytest
-from openpyxl import Workbook
-from openpyxl.styles import Border, Font, PatternFill, Side
+from operator import attrgetter
 
-from xl_borders import set_border
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Border, Side
+from openpyxl.utils.indexed_list import IndexedList
+
+from xl_borders import (
+    MEDIUM,
+    NO_SIDE,
+    THICK,
+    THIN,
+    set_border,
+    set_border_rows,
+    set_borders_bulk,
+)
 from xl_borders.borders import WEIGHT_STYLES
 
+# Range convention: tests use the 2x2 "A1:B2" when corner cells are enough, and
+# the 3x3 "A1:C3" only when they need a true center cell (B2, whose four sides
+# are all inner lines).
 
-@pytest.fixture
-def ws():
-    """Create a fresh worksheet for each test."""
-    wb = Workbook()
-    return wb.active
+# Shared, read-only Side instances; set_border() never mutates the Sides it is given.
+_SIDES = {
+    "thick": Side(style="thick"),
+    "dashed": Side(style="dashed"),
+    "double": Side(style="double"),
+    "none": Side(style=None),
+}
 
 
-class TestSetBorderSingleCell:
-    def test_single_cell_all_sides_thin(self, ws):
-        set_border(ws, "B2")
+def _reset(sheet):
+    """Drop every cell from *sheet* so it behaves like a new worksheet."""
+    sheet._cells.clear()
+    sheet._current_row = 0
+    return sheet
 
-        cell = ws["B2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thin"
-        assert cell.border.top.style == "thin"
-        assert cell.border.bottom.style == "thin"
 
-    def test_single_cell_custom_style(self, ws):
-        set_border(ws, "A1", style="thick")
+def _assert_sides(ws, expected):
+    """Assert border styles given as ``{"B2.left": "thin", ...}``."""
+    for key, side_style in expected.items():
+        coord, side = key.split(".")
+        assert getattr(ws[coord].border, side).style == side_style, key
 
-        cell = ws["A1"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.right.style == "thick"
-        assert cell.border.top.style == "thick"
-        assert cell.border.bottom.style == "thick"
 
+@pytest.fixture(scope="module")
+def wb():
+    """Build one workbook per module; Workbook() is the costly part of setup.
 
-class TestSetBorderRange:
-    def test_range_outer_edges(self, ws):
-        set_border(ws, "A1:C3")
+    Under pytest-xdist each worker imports the module itself, so every worker
+    gets its own workbook and no state is shared across processes.
+    """
+    return Workbook()
 
-        # Top-left corner
-        assert ws["A1"].border.left.style == "thin"
-        assert ws["A1"].border.top.style == "thin"
 
-        # Top-right corner
-        assert ws["C1"].border.right.style == "thin"
-        assert ws["C1"].border.top.style == "thin"
+@pytest.fixture
+def ws(wb):
+    """Return the shared active worksheet, wiped clean for each test."""
+    return _reset(wb.active)
 
-        # Bottom-left corner
-        assert ws["A3"].border.left.style == "thin"
-        assert ws["A3"].border.bottom.style == "thin"
 
-        # Bottom-right corner
-        assert ws["C3"].border.right.style == "thin"
-        assert ws["C3"].border.bottom.style == "thin"
+class TestSetBorderSingleCell:
+    def test_single_cell_all_sides_thin(self, ws):
+        set_border(ws, "B2")
 
-    def test_range_inner_lines(self, ws):
-        set_border(ws, "A1:C3")
+        border = ws["B2"].border
+        assert border.left.style == "thin"
+        assert border.right.style == "thin"
+        assert border.top.style == "thin"
+        assert border.bottom.style == "thin"
 
-        # Center cell should have inner borders
-        center = ws["B2"]
-        assert center.border.left.style == "thin"
-        assert center.border.right.style == "thin"
-        assert center.border.top.style == "thin"
-        assert center.border.bottom.style == "thin"
+    def test_single_cell_custom_style(self, ws):
+        set_border(ws, "A1", style="thick")
 
-    def test_outer_only_no_inner(self, ws):
-        """Set outer borders but no inner lines."""
-        no_side = Side(style=None)
-        set_border(
-            ws,
-            "A1:C3",
-            inner_horizontal=no_side,
-            inner_vertical=no_side,
-        )
+        border = ws["A1"].border
+        assert border.left.style == "thick"
+        assert border.right.style == "thick"
+        assert border.top.style == "thick"
+        assert border.bottom.style == "thick"
 
-        # Outer edges should be thin
-        assert ws["A1"].border.left.style == "thin"
-        assert ws["A1"].border.top.style == "thin"
 
-        # Center cell should have no borders
-        center = ws["B2"]
-        assert center.border.left.style is None
-        assert center.border.right.style is None
-        assert center.border.top.style is None
-        assert center.border.bottom.style is None
+class TestSetBorderRange:
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param(
+                {},
+                {
+                    "A1.left": "thin", "A1.top": "thin",
+                    "C1.right": "thin", "C1.top": "thin",
+                    "A3.left": "thin", "A3.bottom": "thin",
+                    "C3.right": "thin", "C3.bottom": "thin",
+                },
+                id="outer_edges",
+            ),
+            pytest.param(
+                {},
+                {
+                    "B2.left": "thin", "B2.right": "thin",
+                    "B2.top": "thin", "B2.bottom": "thin",
+                },
+                id="inner_lines",
+            ),
+            pytest.param(
+                {
+                    "inner_horizontal": _SIDES["none"],
+                    "inner_vertical": _SIDES["none"],
+                },
+                {
+                    "A1.left": "thin", "A1.top": "thin",
+                    "B2.left": None, "B2.right": None,
+                    "B2.top": None, "B2.bottom": None,
+                },
+                id="outer_only_no_inner",
+            ),
+        ],
+    )
+    def test_range(self, ws, kwargs, expected):
+        set_border(ws, "A1:C3", **kwargs)
+        _assert_sides(ws, expected)
 
 
 class TestSetBorderCustomSides:
     def test_mixed_styles(self, ws):
-        thick = Side(style="thick")
-        dashed = Side(style="dashed")
+        set_border(ws, "A1:B2", left=_SIDES["thick"], top=_SIDES["dashed"])
 
-        set_border(ws, "A1:B2", left=thick, top=dashed)
-
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["A1"].border.top.style == "dashed"
+        a1 = ws["A1"].border
+        assert a1.left.style == "thick"
+        assert a1.top.style == "dashed"
         # Right and bottom default to "thin"
-        assert ws["B2"].border.right.style == "thin"
-        assert ws["B2"].border.bottom.style == "thin"
-
-
-class TestConvenienceParams:
-    def test_outline_only(self, ws):
-        """outline sets outer edges; inside stays at default style."""
-        set_border(ws, "A1:C3", outline="medium")
-
-        # Outer edges are medium
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["A1"].border.top.style == "medium"
-        assert ws["C3"].border.right.style == "medium"
-        assert ws["C3"].border.bottom.style == "medium"
-
-        # Inner lines fall back to default "thin"
-        center = ws["B2"]
-        assert center.border.left.style == "thin"
-        assert center.border.top.style == "thin"
-
-    def test_inside_only(self, ws):
-        """inside sets inner lines; outer edges stay at default style."""
-        set_border(ws, "A1:C3", inside="dashed")
-
-        # Outer edges default to "thin"
-        assert ws["A1"].border.left.style == "thin"
-        assert ws["A1"].border.top.style == "thin"
-
-        # Inner lines are dashed
-        center = ws["B2"]
-        assert center.border.left.style == "dashed"
-        assert center.border.right.style == "dashed"
-        assert center.border.top.style == "dashed"
-        assert center.border.bottom.style == "dashed"
-
-    def test_outline_and_inside(self, ws):
-        """outline + inside covers all 6 positions."""
-        set_border(ws, "A1:C3", outline="medium", inside="dotted")
-
-        # Outer edges
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["A1"].border.top.style == "medium"
-        assert ws["C3"].border.right.style == "medium"
-        assert ws["C3"].border.bottom.style == "medium"
-
-        # Inner lines
-        center = ws["B2"]
-        assert center.border.left.style == "dotted"
-        assert center.border.right.style == "dotted"
-        assert center.border.top.style == "dotted"
-        assert center.border.bottom.style == "dotted"
-
-    def test_horizontal_and_vertical(self, ws):
-        """horizontal/vertical split borders by orientation."""
-        set_border(ws, "A1:C3", horizontal="thin", vertical="thick")
-
-        # Top-left corner: left=thick (vertical), top=thin (horizontal)
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["A1"].border.top.style == "thin"
+        b2 = ws["B2"].border
+        assert b2.right.style == "thin"
+        assert b2.bottom.style == "thin"
 
-        # Center cell: all lines from h/v
-        center = ws["B2"]
-        assert center.border.left.style == "thick"   # inner_vertical
-        assert center.border.right.style == "thick"   # inner_vertical
-        assert center.border.top.style == "thin"       # inner_horizontal
-        assert center.border.bottom.style == "thin"    # inner_horizontal
-
-    def test_individual_side_overrides_convenience(self, ws):
-        """An explicit Side param takes priority over convenience params."""
+    def test_all_six_sides(self, ws):
         set_border(
-            ws, "A1:C3",
-            outline="medium",
-            left=Side(style="double"),
+            ws, "A1:C3", color="00FF00",
+            left=_SIDES["thick"], right="double", top=("dashed", "FF0000"),
+            bottom=THICK, inner_horizontal="dotted", inner_vertical=MEDIUM,
         )
 
-        # left overridden to double
-        assert ws["A1"].border.left.style == "double"
-        assert ws["A2"].border.left.style == "double"
+        _assert_sides(ws, {
+            "A1.left": "thick", "C3.right": "double",
+            "A1.top": "dashed", "C3.bottom": "thick",
+            "B2.top": "dotted", "B2.left": "medium",
+        })
+        assert ws["C1"].border.right.color.rgb == "0000FF00"
+        assert ws["B1"].border.top.color.rgb == "00FF0000"
+
+    def test_all_six_sides_invalid_style_raises(self, ws):
+        """style is validated even though all six sides override it."""
+        with pytest.raises(ValueError):
+            set_border(
+                ws, "A1", style="bogus",
+                left=THICK, right=THICK, top=THICK, bottom=THICK,
+                inner_horizontal=THICK, inner_vertical=THICK,
+            )
+
 
-        # other outer edges still medium
-        assert ws["A1"].border.top.style == "medium"
-        assert ws["C3"].border.right.style == "medium"
-        assert ws["C3"].border.bottom.style == "medium"
+class TestConvenienceParams:
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            # outline sets outer edges; inner lines fall back to default style
+            pytest.param(
+                {"outline": "medium"},
+                {
+                    "A1.left": "medium", "A1.top": "medium",
+                    "C3.right": "medium", "C3.bottom": "medium",
+                    "B2.left": "thin", "B2.top": "thin",
+                },
+                id="outline_only",
+            ),
+            # inside sets inner lines; outer edges stay at default style
+            pytest.param(
+                {"inside": "dashed"},
+                {
+                    "A1.left": "thin", "A1.top": "thin",
+                    "B2.left": "dashed", "B2.right": "dashed",
+                    "B2.top": "dashed", "B2.bottom": "dashed",
+                },
+                id="inside_only",
+            ),
+            # horizontal/vertical split borders by orientation
+            pytest.param(
+                {"horizontal": "thin", "vertical": "thick"},
+                {
+                    "A1.left": "thick", "A1.top": "thin",
+                    "B2.left": "thick", "B2.right": "thick",
+                    "B2.top": "thin", "B2.bottom": "thin",
+                },
+                id="horizontal_and_vertical",
+            ),
+        ],
+    )
+    def test_convenience(self, ws, kwargs, expected):
+        set_border(ws, "A1:C3", **kwargs)
+        _assert_sides(ws, expected)
 
     def test_single_cell_with_outline(self, ws):
         """On a single cell, outline applies to all 4 sides."""
         set_border(ws, "B2", outline="medium")
 
-        cell = ws["B2"]
-        assert cell.border.left.style == "medium"
-        assert cell.border.right.style == "medium"
-        assert cell.border.top.style == "medium"
-        assert cell.border.bottom.style == "medium"
+        border = ws["B2"].border
+        assert border.left.style == "medium"
+        assert border.right.style == "medium"
+        assert border.top.style == "medium"
+        assert border.bottom.style == "medium"
 
 
 class TestCustomParam:
-    def test_6_element_tuple(self, ws):
-        """All 6 sides set via custom=(top, right, bottom, left, ih, iv)."""
-        # top=thick, right=medium, bottom=thick, left=medium, ih=thin, iv=medium
-        set_border(ws, "A1:C3", custom=(3, 2, 3, 2, 1, 2))
-
-        # Top-left corner: top=thick, left=medium
-        assert ws["A1"].border.top.style == "thick"
-        assert ws["A1"].border.left.style == "medium"
-
-        # Bottom-right corner: bottom=thick, right=medium
-        assert ws["C3"].border.bottom.style == "thick"
-        assert ws["C3"].border.right.style == "medium"
-
-        # Center cell: inner borders (ih=thin, iv=medium)
-        center = ws["B2"]
-        assert center.border.top.style == "thin"
-        assert center.border.bottom.style == "thin"
-        assert center.border.left.style == "medium"
-        assert center.border.right.style == "medium"
-
-    def test_4_element_tuple(self, ws):
-        """4-element tuple sets outer sides; inner defaults to no border."""
-        # top=thick, right=medium, bottom=thick, left=medium
-        set_border(ws, "A1:C3", custom=(3, 2, 3, 2))
-
-        # Outer edges are set
-        assert ws["A1"].border.top.style == "thick"
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["C3"].border.bottom.style == "thick"
-        assert ws["C3"].border.right.style == "medium"
-
-        # Inner lines default to 0 (no border)
-        center = ws["B2"]
-        assert center.border.top.style is None
-        assert center.border.bottom.style is None
-        assert center.border.left.style is None
-        assert center.border.right.style is None
-
-    def test_custom_with_outline_override(self, ws):
-        """outline (layer 3) overrides custom (layer 2) for outer edges."""
-        set_border(ws, "A1:C3", custom=(1, 1, 1, 1, 1, 1), outline="thick")
-
-        # Outer edges overridden by outline
-        assert ws["A1"].border.top.style == "thick"
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["C3"].border.bottom.style == "thick"
-        assert ws["C3"].border.right.style == "thick"
-
-        # Inner lines still from custom (thin)
-        center = ws["B2"]
-        assert center.border.top.style == "thin"
-        assert center.border.left.style == "thin"
-
-    def test_custom_with_individual_side_override(self, ws):
-        """Individual Side param (layer 5) overrides custom (layer 2)."""
-        set_border(
-            ws, "A1:C3",
-            custom=(1, 1, 1, 1, 1, 1),
-            left=Side(style="double"),
-        )
-
-        # left overridden to double
-        assert ws["A1"].border.left.style == "double"
-        assert ws["A2"].border.left.style == "double"
-
-        # Other outer edges still thin from custom
-        assert ws["A1"].border.top.style == "thin"
-        assert ws["C3"].border.right.style == "thin"
-
-    def test_invalid_length_raises(self, ws):
-        """custom tuple with length != 4 or 6 raises ValueError."""
-        with pytest.raises(ValueError, match="4 or 6 elements"):
-            set_border(ws, "A1:C3", custom=(1, 2, 3))
-
-        with pytest.raises(ValueError, match="4 or 6 elements"):
-            set_border(ws, "A1:C3", custom=(1, 2, 3, 1, 2))
-
-    def test_invalid_weight_raises(self, ws):
-        """custom tuple with weight not in WEIGHT_STYLES raises ValueError."""
-        with pytest.raises(ValueError, match="not a valid weight"):
-            set_border(ws, "A1:C3", custom=(1, 2, 5, 1))
+    @pytest.mark.parametrize(
+        "custom, expected",
+        [
+            # (top, right, bottom, left, ih, iv)
+            pytest.param(
+                (3, 2, 3, 2, 1, 2),
+                {
+                    "A1.top": "thick", "A1.left": "medium",
+                    "C3.bottom": "thick", "C3.right": "medium",
+                    "B2.top": "thin", "B2.bottom": "thin",
+                    "B2.left": "medium", "B2.right": "medium",
+                },
+                id="6_element_tuple",
+            ),
+            # 4-element tuple sets outer sides; inner defaults to no border
+            pytest.param(
+                (3, 2, 3, 2),
+                {
+                    "A1.top": "thick", "A1.left": "medium",
+                    "C3.bottom": "thick", "C3.right": "medium",
+                    "B2.top": None, "B2.bottom": None,
+                    "B2.left": None, "B2.right": None,
+                },
+                id="4_element_tuple",
+            ),
+        ],
+    )
+    def test_custom(self, ws, custom, expected):
+        set_border(ws, "A1:C3", custom=custom)
+        _assert_sides(ws, expected)
+
+    @pytest.mark.parametrize(
+        "custom",
+        [[3, 2, 3, 2], [3, 2, 3, 2, 0, 0]],
+        ids=["4_element_list", "6_element_list"],
+    )
+    def test_custom_list(self, ws, custom):
+        """A list works like the equivalent tuple."""
+        set_border(ws, "A1:C3", custom=custom)  # type: ignore[arg-type]
+        _assert_sides(ws, {
+            "A1.top": "thick", "A1.left": "medium",
+            "C3.bottom": "thick", "B2.left": None,
+        })
+
+    @pytest.mark.parametrize(
+        "custom, match",
+        [
+            ((1, 2, 3), "4 or 6 elements"),
+            ((1, 2, 3, 1, 2), "4 or 6 elements"),
+            ((1, 2, 5, 1), "not a valid weight"),
+        ],
+    )
+    def test_invalid_custom_raises(self, ws, custom, match):
+        """custom must have 4 or 6 weights, each a key of WEIGHT_STYLES."""
+        with pytest.raises(ValueError, match=match):
+            set_border(ws, "A1:C3", custom=custom)
+
+    def test_invalid_style_with_custom_raises(self, ws):
+        """style is validated even though custom replaces every side."""
+        with pytest.raises(ValueError):
+            set_border(ws, "A1", style="bogus", custom=(1, 1, 1, 1))
+
+
+PRECEDENCE_CASES = [
+    # outline + inside (layer 3) cover all 6 positions
+    pytest.param(
+        {"outline": "medium", "inside": "dotted"},
+        {
+            "A1.left": "medium", "A1.top": "medium",
+            "C3.right": "medium", "C3.bottom": "medium",
+            "B2.left": "dotted", "B2.right": "dotted",
+            "B2.top": "dotted", "B2.bottom": "dotted",
+        },
+        id="outline_and_inside",
+    ),
+    # explicit Side (layer 5) overrides outline (layer 3)
+    pytest.param(
+        {"outline": "medium", "left": _SIDES["double"]},
+        {
+            "A1.left": "double", "A2.left": "double",
+            "A1.top": "medium", "C3.right": "medium", "C3.bottom": "medium",
+        },
+        id="side_overrides_outline",
+    ),
+    # outline (layer 3) overrides custom (layer 2) on outer edges only
+    pytest.param(
+        {"custom": (1, 1, 1, 1, 1, 1), "outline": "thick"},
+        {
+            "A1.top": "thick", "A1.left": "thick",
+            "C3.bottom": "thick", "C3.right": "thick",
+            "B2.top": "thin", "B2.left": "thin",
+        },
+        id="outline_overrides_custom",
+    ),
+    # explicit Side (layer 5) overrides custom (layer 2)
+    pytest.param(
+        {"custom": (1, 1, 1, 1, 1, 1), "left": _SIDES["double"]},
+        {
+            "A1.left": "double", "A2.left": "double",
+            "A1.top": "thin", "C3.right": "thin",
+        },
+        id="side_overrides_custom",
+    ),
+    # str shorthand (layer 5) overrides outline (layer 3)
+    pytest.param(
+        {"outline": "medium", "left": "double"},
+        {"A1.left": "double", "A1.top": "medium"},
+        id="str_shorthand_overrides_outline",
+    ),
+]
+
+
+class TestLayerPrecedence:
+    @pytest.mark.parametrize("kwargs, expected", PRECEDENCE_CASES)
+    def test_layer_precedence(self, ws, kwargs, expected):
+        set_border(ws, "A1:C3", **kwargs)
+        _assert_sides(ws, expected)
 
 
 class TestColorParam:
     def test_color_applies_to_all_sides(self, ws):
         """Base color is applied to every side."""
-        set_border(ws, "A1:C3", color="FF0000")
+        set_border(ws, "A1:B2", color="FF0000")
 
-        cell = ws["A1"]
-        assert cell.border.left.color.rgb == "00FF0000"
-        assert cell.border.top.color.rgb == "00FF0000"
-        assert cell.border.left.style == "thin"
+        border = ws["A1"].border
+        assert border.left.color.rgb == "00FF0000"
+        assert border.top.color.rgb == "00FF0000"
+        assert border.left.style == "thin"
 
-        center = ws["B2"]
-        assert center.border.left.color.rgb == "00FF0000"
-        assert center.border.top.color.rgb == "00FF0000"
+        b2 = ws["B2"].border
+        assert b2.left.color.rgb == "00FF0000"
+        assert b2.top.color.rgb == "00FF0000"
 
     def test_color_with_style(self, ws):
         """color composes with style."""
         set_border(ws, "B2", style="thick", color="0000FF")
 
-        cell = ws["B2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.left.color.rgb == "000000FF"
+        border = ws["B2"].border
+        assert border.left.style == "thick"
+        assert border.left.color.rgb == "000000FF"
 
     def test_color_with_custom(self, ws):
         """color propagates through custom weights."""
-        set_border(ws, "A1:C3", custom=(3, 2, 3, 2, 1, 1), color="00FF00")
+        set_border(ws, "A1:B2", custom=(3, 2, 3, 2, 1, 1), color="00FF00")
 
-        assert ws["A1"].border.top.style == "thick"
-        assert ws["A1"].border.top.color.rgb == "0000FF00"
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["A1"].border.left.color.rgb == "0000FF00"
+        a1 = ws["A1"].border
+        assert a1.top.style == "thick"
+        assert a1.top.color.rgb == "0000FF00"
+        assert a1.left.style == "medium"
+        assert a1.left.color.rgb == "0000FF00"
 
-        # Inner lines also get the color
-        center = ws["B2"]
-        assert center.border.top.style == "thin"
-        assert center.border.top.color.rgb == "0000FF00"
+        # Inner lines (B2 top) also get the color
+        b2 = ws["B2"].border
+        assert b2.top.style == "thin"
+        assert b2.top.color.rgb == "0000FF00"
 
     def test_color_with_outline(self, ws):
         """color propagates through outline."""
-        set_border(ws, "A1:C3", outline="medium", color="FF0000")
+        set_border(ws, "A1:B2", outline="medium", color="FF0000")
 
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["A1"].border.left.color.rgb == "00FF0000"
+        a1 = ws["A1"].border
+        assert a1.left.style == "medium"
+        assert a1.left.color.rgb == "00FF0000"
 
     def test_no_color_by_default(self, ws):
         """Without color param, sides have no color set."""
         set_border(ws, "B2")
 
-        cell = ws["B2"]
-        assert cell.border.left.color is None
+        border = ws["B2"].border
+        assert border.left.color is None
 
 
 class TestSideShorthand:
     def test_str_shorthand(self, ws):
         """A plain string sets the style, inheriting base color."""
-        set_border(ws, "A1:C3", left="thick", color="FF0000")
+        set_border(ws, "A1:B2", left="thick", color="FF0000")
 
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["A1"].border.left.color.rgb == "00FF0000"
+        a1 = ws["A1"].border
+        assert a1.left.style == "thick"
+        assert a1.left.color.rgb == "00FF0000"
         # Other sides still default
-        assert ws["A1"].border.top.style == "thin"
+        assert a1.top.style == "thin"
+
+    def test_prebuilt_side_constants(self, ws):
+        """Exported Side constants work as side specs."""
+        set_border(ws, "B2", left=THICK, top=MEDIUM, bottom=NO_SIDE)
+
+        border = ws["B2"].border
+        assert border.left.style == "thick"
+        assert border.top.style == "medium"
+        assert border.right.style == "thin"
+        assert border.bottom.style is None
 
     def test_str_shorthand_no_base_color(self, ws):
         """A plain string without base color produces a Side with no color."""
         set_border(ws, "B2", left="thick")
 
-        cell = ws["B2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.left.color is None
+        border = ws["B2"].border
+        assert border.left.style == "thick"
+        assert border.left.color is None
 
     def test_tuple_shorthand(self, ws):
         """A (style, color) tuple sets both, ignoring base color."""
         set_border(
-            ws, "A1:C3",
+            ws, "A1:B2",
             color="0000FF",
             left=("thick", "FF0000"),
         )
 
         # left uses tuple color, not base color
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["A1"].border.left.color.rgb == "00FF0000"
+        a1 = ws["A1"].border
+        assert a1.left.style == "thick"
+        assert a1.left.color.rgb == "00FF0000"
 
         # Other sides use base color
-        assert ws["A1"].border.top.color.rgb == "000000FF"
+        assert a1.top.color.rgb == "000000FF"
 
-    def test_side_object_still_works(self, ws):
+    def test_side_object_still_works(self, ws, palette):
         """Passing a Side object directly still works as before."""
-        set_border(ws, "B2", left=Side(style="double", color="00FF00"))
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "double"
-        assert cell.border.left.color.rgb == "0000FF00"
-
-    def test_str_shorthand_overrides_outline(self, ws):
-        """String shorthand at layer 5 overrides outline at layer 3."""
-        set_border(ws, "A1:C3", outline="medium", left="double")
+        set_border(ws, "B2", left=palette["double_green"])
 
-        assert ws["A1"].border.left.style == "double"
-        assert ws["A1"].border.top.style == "medium"
+        border = ws["B2"].border
+        assert border.left.style == "double"
+        assert border.left.color.rgb == "0000FF00"
 
 
 class TestNumericRange:
@@ -381,159 +442,218 @@ class TestNumericRange:
         """(row, col) targets a single cell."""
         set_border(ws, (2, 2))  # B2
 
-        cell = ws.cell(row=2, column=2)
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thin"
-        assert cell.border.top.style == "thin"
-        assert cell.border.bottom.style == "thin"
+        border = ws.cell(row=2, column=2).border
+        assert border.left.style == "thin"
+        assert border.right.style == "thin"
+        assert border.top.style == "thin"
+        assert border.bottom.style == "thin"
 
     def test_range_tuple(self, ws):
         """((min_row, min_col), (max_row, max_col)) matches equivalent string."""
         set_border(ws, ((1, 1), (3, 3)))  # A1:C3
 
         # Same assertions as test_range_outer_edges
-        assert ws["A1"].border.left.style == "thin"
-        assert ws["A1"].border.top.style == "thin"
+        a1 = ws["A1"].border
+        assert a1.left.style == "thin"
+        assert a1.top.style == "thin"
         assert ws["C1"].border.right.style == "thin"
         assert ws["C3"].border.bottom.style == "thin"
 
         # Inner
-        center = ws["B2"]
-        assert center.border.left.style == "thin"
-        assert center.border.top.style == "thin"
+        center = ws["B2"].border
+        assert center.left.style == "thin"
+        assert center.top.style == "thin"
 
     def test_range_tuple_with_kwargs(self, ws):
         """Numeric range works with all keyword params."""
         set_border(ws, ((1, 1), (3, 3)), outline="medium", inside="dashed")
 
-        assert ws["A1"].border.left.style == "medium"
-        assert ws["A1"].border.top.style == "medium"
+        a1 = ws["A1"].border
+        assert a1.left.style == "medium"
+        assert a1.top.style == "medium"
 
-        center = ws["B2"]
-        assert center.border.left.style == "dashed"
-        assert center.border.top.style == "dashed"
+        center = ws["B2"].border
+        assert center.left.style == "dashed"
+        assert center.top.style == "dashed"
 
     def test_numeric_matches_string(self, ws):
         """Numeric range produces identical result to equivalent string range."""
-        wb2 = Workbook()
-        ws2 = wb2.active
+        # Both runs share one workbook, so equal borders share a borderId.
+        def border_ids():
+            return [
+                ws.cell(row=r, column=c)._style.borderId
+                for r in range(1, 4) for c in range(1, 4)
+            ]
 
         set_border(ws, "A1:C3", style="thick")
-        set_border(ws2, ((1, 1), (3, 3)), style="thick")
-
-        for row in range(1, 4):
-            for col in range(1, 4):
-                b1 = ws.cell(row=row, column=col).border
-                b2 = ws2.cell(row=row, column=col).border
-                assert b1.left.style == b2.left.style
-                assert b1.right.style == b2.right.style
-                assert b1.top.style == b2.top.style
-                assert b1.bottom.style == b2.bottom.style
-
-    def test_invalid_type_raises(self, ws):
-        """Invalid cell_range type raises TypeError."""
+        expected = border_ids()
+
+        _reset(ws)
+        set_border(ws, ((1, 1), (3, 3)), style="thick")
+        assert border_ids() == expected
+
+    @pytest.mark.parametrize(
+        "cell_range",
+        [
+            pytest.param(42, id="int"),
+            pytest.param((1, "B"), id="non_int_pair"),
+            pytest.param(((1, 1), (3,)), id="short_corner"),
+            pytest.param([2, 2], id="list_pair"),
+            pytest.param(((1, 1), [3, 3]), id="list_corner"),
+        ],
+    )
+    def test_invalid_type_raises(self, ws, cell_range):
+        """Invalid cell_range type or malformed pair raises TypeError."""
         with pytest.raises(TypeError, match="cell_range must be"):
-            set_border(ws, 42)  # type: ignore[arg-type]
+            set_border(ws, cell_range)
+
+
+class TestWorksheetKinds:
+    def test_write_only_raises(self):
+        ws = Workbook(write_only=True).create_sheet()
+        with pytest.raises(TypeError, match="WriteOnlyWorksheet"):
+            set_border(ws, "A1:B2")
+
+    def test_read_only_raises(self, tmp_path):
+        path = tmp_path / "book.xlsx"
+        Workbook().save(path)
+        ws = load_workbook(path, read_only=True).active
+        with pytest.raises(TypeError, match="ReadOnlyWorksheet"):
+            set_border(ws, "A1:B2")
+
+
+class TestStyleCache:
+    def test_repeat_call_adds_no_borders(self):
+        wb = Workbook()
+        set_border(wb.active, "A1:C3", outline="thick")
+        count = len(wb._borders)
+        set_border(wb.active, "A1:C3", outline="thick")
+        assert len(wb._borders) == count
+
+    def test_replaced_registry(self):
+        wb = Workbook()
+        set_border(wb.active, "A1:B2", style="thick")
+        wb.active._cells.clear()
+        wb._borders = IndexedList([Border()])
+
+        set_border(wb.active, "A1:B2", style="thick")
+        assert wb.active["B2"].border.right.style == "thick"
+
+    def test_mutated_side_stays_in_its_workbook(self):
+        """Sides reachable from one workbook's cells are not reused elsewhere."""
+        ws1 = Workbook().active
+        set_border(ws1, "A1")
+        ws1["A1"].border.left.style = "dashed"
+
+        ws2 = Workbook().active
+        set_border(ws2, "B2")
+        assert ws2["B2"].border.left.style == "thin"
+        assert THIN.style == "thin"
 
 
 class TestPreserveCellFormatting:
     """set_border() must not overwrite font, fill, or alignment."""
 
-    def test_preserves_font(self, ws):
-        ws["B2"].font = Font(bold=True, color="FF0000", size=14)
+    def test_preserves_font_fill_alignment(self, ws):
+        from openpyxl.styles import Alignment, Font, PatternFill
+
+        cell = ws["B2"]
+        cell.font = Font(bold=True, color="FF0000", size=14)
+        cell.fill = PatternFill(fgColor="FFFF00", patternType="solid")
+        cell.alignment = Alignment(horizontal="center", wrap_text=True)
         set_border(ws, "A1:C3")
 
-        font = ws["B2"].font
+        font = cell.font
         assert font.bold is True
         assert font.color.rgb == "00FF0000"
         assert font.size == 14
 
-    def test_preserves_fill(self, ws):
-        ws["B2"].fill = PatternFill(fgColor="FFFF00", patternType="solid")
-        set_border(ws, "A1:C3")
-
-        fill = ws["B2"].fill
+        fill = cell.fill
         assert fill.fgColor.rgb == "00FFFF00"
         assert fill.patternType == "solid"
 
+        alignment = cell.alignment
+        assert alignment.horizontal == "center"
+        assert alignment.wrap_text is True
+
 
 class TestPreserveBorderColor:
     """Border color merging: preserve existing color when not specified."""
 
-    def test_preserves_color_when_no_color_param(self, ws):
-        """Existing red border -> set_border() without color -> red preserved."""
-        ws["B2"].border = Border(
-            left=Side(style="thin", color="FF0000"),
-            top=Side(style="thin", color="FF0000"),
-        )
-        set_border(ws, "B2")
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.left.color.rgb == "00FF0000"
-        assert cell.border.top.color.rgb == "00FF0000"
-
-    def test_overwrites_color_when_color_param_set(self, ws):
-        """Existing red border -> set_border(color='0000FF') -> blue."""
-        ws["B2"].border = Border(
-            left=Side(style="thin", color="FF0000"),
-        )
-        set_border(ws, "B2", color="0000FF")
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.left.color.rgb == "000000FF"
-
-    def test_preserves_color_with_style_change(self, ws):
-        """Change style but keep existing color when color param not set."""
-        ws["B2"].border = Border(
-            left=Side(style="thin", color="FF0000"),
-        )
-        set_border(ws, "B2", style="thick")
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.left.color.rgb == "00FF0000"
-
-    def test_tuple_shorthand_color_overrides_existing(self, ws):
-        """Explicit color in (style, color) tuple overrides existing."""
-        ws["B2"].border = Border(
-            left=Side(style="thin", color="FF0000"),
-        )
-        set_border(ws, "B2", left=("thick", "00FF00"))
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.left.color.rgb == "0000FF00"
+    @pytest.mark.parametrize(
+        "initial, kwargs, expected",
+        [
+            # Existing red border -> set_border() without color -> red preserved
+            pytest.param(
+                {"left": "thin_red", "top": "thin_red"},
+                {},
+                {
+                    "left.style": "thin",
+                    "left.color.rgb": "00FF0000",
+                    "top.color.rgb": "00FF0000",
+                },
+                id="preserves_color_when_no_color_param",
+            ),
+            # Existing red border -> set_border(color="0000FF") -> blue
+            pytest.param(
+                {"left": "thin_red"},
+                {"color": "0000FF"},
+                {"left.style": "thin", "left.color.rgb": "000000FF"},
+                id="overwrites_color_when_color_param_set",
+            ),
+            # Change style but keep existing color when color param not set
+            pytest.param(
+                {"left": "thin_red"},
+                {"style": "thick"},
+                {"left.style": "thick", "left.color.rgb": "00FF0000"},
+                id="preserves_color_with_style_change",
+            ),
+            # Explicit color in (style, color) tuple overrides existing
+            pytest.param(
+                {"left": "thin_red"},
+                {"left": ("thick", "00FF00")},
+                {"left.style": "thick", "left.color.rgb": "0000FF00"},
+                id="tuple_shorthand_color_overrides_existing",
+            ),
+        ],
+    )
+    def test_preserve_border_color(self, ws, palette, initial, kwargs, expected):
+        ws["B2"].border = Border(**{k: palette[v] for k, v in initial.items()})
+        set_border(ws, "B2", **kwargs)
+
+        border = ws["B2"].border
+        for path, value in expected.items():
+            assert attrgetter(path)(border) == value, path
 
 
 class TestPreserveExistingBorders:
     """Existing borders are kept when set_border() doesn't configure that side."""
 
-    def test_custom_4_preserves_unset_inner_borders(self, ws):
+    def test_custom_4_preserves_unset_inner_borders(self, ws, palette):
         """4-element custom sets outer only; existing inner borders preserved."""
         # Pre-set inner borders on center cell
         ws["B2"].border = Border(
-            left=Side(style="dashed", color="FF0000"),
-            top=Side(style="dashed", color="FF0000"),
+            left=palette["dashed_red"],
+            top=palette["dashed_red"],
         )
         set_border(ws, "A1:C3", custom=(3, 3, 3, 3))
 
         # Outer edges set to thick
-        assert ws["A1"].border.left.style == "thick"
-        assert ws["A1"].border.top.style == "thick"
+        a1 = ws["A1"].border
+        assert a1.left.style == "thick"
+        assert a1.top.style == "thick"
 
         # Center cell: inner sides resolve to style=None -> existing preserved
-        center = ws["B2"]
-        assert center.border.left.style == "dashed"
-        assert center.border.left.color.rgb == "00FF0000"
-        assert center.border.top.style == "dashed"
+        center = ws["B2"].border
+        assert center.left.style == "dashed"
+        assert center.left.color.rgb == "00FF0000"
+        assert center.top.style == "dashed"
 
     def test_outline_only_preserves_existing_inner(self, ws):
         """outline + no inside: inner lines keep default style, not cleared."""
         ws["B2"].border = Border(
-            left=Side(style="double"),
-            top=Side(style="double"),
+            left=_SIDES["double"],
+            top=_SIDES["double"],
         )
         set_border(ws, "A1:C3", outline="thick")
 
@@ -541,15 +661,62 @@ class TestPreserveExistingBorders:
         assert ws["A1"].border.left.style == "thick"
 
         # Inner: style defaults to "thin" (from base style param), overrides existing
-        center = ws["B2"]
-        assert center.border.left.style == "thin"
-        assert center.border.top.style == "thin"
+        center = ws["B2"].border
+        assert center.left.style == "thin"
+        assert center.top.style == "thin"
 
-    def test_none_side_preserves_existing(self, ws):
+    def test_none_side_preserves_existing(self, ws, palette):
         """Explicitly passing Side(style=None) preserves existing border."""
-        ws["B2"].border = Border(left=Side(style="thick", color="FF0000"))
-        set_border(ws, "B2", left=Side(style=None))
-
-        cell = ws["B2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.left.color.rgb == "00FF0000"
+        ws["B2"].border = Border(left=palette["thick_red"])
+        set_border(ws, "B2", left=_SIDES["none"])
+
+        border = ws["B2"].border
+        assert border.left.style == "thick"
+        assert border.left.color.rgb == "00FF0000"
+
+
+class TestBulk:
+    _KWARGS = {"outline": "thick", "inside": "dashed", "bottom": "double"}
+
+    def _borders(self, ws, rng):
+        edges = attrgetter("left", "right", "top", "bottom")
+        return [
+            [side.style for side in edges(c.border)]
+            for row in ws[rng]
+            for c in row
+        ]
+
+    def test_bulk_matches_set_border(self, ws):
+        ranges = ["A1:C3", "B2:D4", "F1", (6, 1), ((6, 3), (7, 5))]
+        set_borders_bulk(ws, ranges, **self._KWARGS)
+        bulk = self._borders(ws, "A1:F7")
+
+        _reset(ws)
+        for rng in ranges:
+            set_border(ws, rng, **self._KWARGS)
+        assert self._borders(ws, "A1:F7") == bulk
+
+    @pytest.mark.parametrize(
+        "bad, error",
+        [
+            pytest.param(42, TypeError, id="wrong_type"),
+            pytest.param("C:D", ValueError, id="open_ended"),
+            pytest.param(((0, 1), (2, 2)), ValueError, id="below_one"),
+        ],
+    )
+    def test_invalid_range_leaves_sheet_untouched(self, ws, bad, error):
+        with pytest.raises(error):
+            set_borders_bulk(ws, ["A1:B2", bad])
+        assert ws["A1"].border.left.style is None
+
+    def test_bare_string_raises(self, ws):
+        with pytest.raises(TypeError, match="not a str"):
+            set_borders_bulk(ws, "A1:C3")  # type: ignore[arg-type]
+
+    def test_rows(self, ws):
+        set_border_rows(ws, [1, 3], (1, 2), bottom="thick")
+
+        for cell in ("A1", "B1", "A3", "B3"):
+            assert ws[cell].border.bottom.style == "thick"
+            assert ws[cell].border.top.style == "thin"
+        assert ws["A2"].border.bottom.style is None
@@ -1,5 +1,21 @@
 """xl-borders: Build Excel cell borders with simple range syntax, like VBA."""
 
-from xl_borders.borders import set_border
+from xl_borders.borders import (
+    MEDIUM,
+    NO_SIDE,
+    THICK,
+    THIN,
+    set_border,
+    set_border_rows,
+    set_borders_bulk,
+)
 
-__all__ = ["set_border"]
+__all__ = [
+    "MEDIUM",
+    "NO_SIDE",
+    "THICK",
+    "THIN",
+    "set_border",
+    "set_border_rows",
+    "set_borders_bulk",
+]
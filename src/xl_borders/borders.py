@@ -2,16 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import cast
+from weakref import WeakKeyDictionary
+
+from openpyxl.cell import Cell
 from openpyxl.styles import Border, Side
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils import range_boundaries
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+__all__ = [
+    "DEFAULT_SIDE",
+    "MEDIUM",
+    "NO_SIDE",
+    "THICK",
+    "THIN",
+    "WEIGHT_STYLES",
+    "CellRange",
+    "SideSpec",
+    "set_border",
+    "set_border_rows",
+    "set_borders_bulk",
+]
+
+# Prebuilt colorless Sides for use as side specs.
 THIN = Side(style="thin")
+MEDIUM = Side(style="medium")
+THICK = Side(style="thick")
 NO_SIDE = Side(style=None)
 
 DEFAULT_SIDE = THIN
 
 WEIGHT_STYLES: dict[int, str | None] = {0: None, 1: "thin", 2: "medium", 3: "thick"}
+_VALID_WEIGHTS = frozenset(WEIGHT_STYLES)
+_VALID_WEIGHTS_SORTED = sorted(WEIGHT_STYLES)
+
+# Bit flags for the range edges a cell touches.
+_TOP, _BOTTOM, _LEFT, _RIGHT = 1, 2, 4, 8
 
 # Shorthand type accepted for individual side params:
 #   Side        - full control
@@ -25,6 +57,85 @@ type SideSpec = Side | str | tuple[str, str] | None
 #   ((int, int), (int, int))         - ((min_row, min_col), (max_row, max_col))
 type CellRange = str | tuple[int, int] | tuple[tuple[int, int], tuple[int, int]]
 
+# Resolved (left, right, top, bottom, inner_horizontal, inner_vertical) sides.
+type _Sides = tuple[Side, Side, Side, Side, Side, Side]
+
+# (Border for one range position, its merge memo); see _apply_border.
+type _PositionEntry = tuple[Border, dict[int, int]]
+
+# Position bit mask -> that position's entry, or None until first used.
+type _PositionTable = list[_PositionEntry | None]
+
+
+class _StyleCache:
+    """Sides, Borders and merge memos interned for one workbook.
+
+    Everything built here ends up reachable from the workbook's cells (e.g.
+    ``cell.border.left``), so it is never shared with another workbook: a
+    caller mutating one of these objects can only affect the workbook it came
+    from.
+    """
+
+    __slots__ = ("registry", "sides", "layers", "borders", "memos")
+
+    def __init__(self, registry: IndexedList) -> None:
+        self.registry = registry
+        # (style, color) -> Side
+        self.sides: dict[tuple[str | None, str | None], Side] = {}
+        # Layer 1-4 params -> resolved sides; see _resolve_layered_sides.
+        self.layers: dict[tuple, _Sides] = {}
+        # ids of (left, right, top, bottom) -> Border holding those Sides.
+        self.borders: dict[tuple[int, int, int, int], Border] = {}
+        # id(Border) -> (Border, merge memo); see _stamp.
+        self.memos: dict[int, _PositionEntry] = {}
+
+
+_STYLE_CACHES: WeakKeyDictionary[Workbook, _StyleCache] = WeakKeyDictionary()
+
+
+def _style_cache(wb: Workbook) -> _StyleCache:
+    """Return *wb*'s style cache, starting a new one if its registry changed.
+
+    Merge memos map border registry indices, which stay valid while the
+    registry only grows, so the cache outlives a single call.
+    """
+    registry = wb._borders
+    cache = _STYLE_CACHES.get(wb)
+    if cache is None or cache.registry is not registry:
+        # First use, or the registry was replaced: old indices are meaningless.
+        cache = _STYLE_CACHES[wb] = _StyleCache(registry)
+    return cache
+
+
+def _make_side(cache: _StyleCache, style: str | None, color: str | None) -> Side:
+    """Return the workbook's shared Side for *style* and *color*.
+
+    Identical specs across calls reuse one instance instead of re-running
+    openpyxl's descriptor validation.
+    """
+    side = cache.sides.get((style, color))
+    if side is None:
+        side = cache.sides[style, color] = Side(style=style, color=color)
+    return side
+
+
+def _border(
+    cache: _StyleCache, left: Side, right: Side, top: Side, bottom: Side,
+) -> Border:
+    """Return the workbook's shared Border with the given four edges.
+
+    Keyed by Side identity: the cached Border holds its Sides, so their ids
+    cannot be reused while the entry exists, and no Side is hashed.
+    """
+    key = (id(left), id(right), id(top), id(bottom))
+    border = cache.borders.get(key)
+    if border is None:
+        # Border.__init__ takes (left, right, top, bottom, ...) first in the
+        # supported openpyxl versions (>=3.1.5); passing positionally skips the
+        # kwargs dict.
+        border = cache.borders[key] = Border(left, right, top, bottom)
+    return border
+
 
 def _merge_side(new: Side, existing: Side | None) -> Side:
     """Merge a new Side with an existing Side on a cell.
@@ -43,7 +154,115 @@ def _merge_side(new: Side, existing: Side | None) -> Side:
     return new
 
 
-def _resolve_side(spec: SideSpec, base_color: str | None) -> Side | None:
+def _merge_border(cache: _StyleCache, new: Border, existing: Border) -> Border:
+    """Merge the four edges of *new* onto *existing* via :func:`_merge_side`."""
+    return _border(
+        cache,
+        _merge_side(new.left, existing.left),
+        _merge_side(new.right, existing.right),
+        _merge_side(new.top, existing.top),
+        _merge_side(new.bottom, existing.bottom),
+    )
+
+
+def _stamp(
+    cells: Iterable[Cell],
+    new: Border,
+    merged: dict[int, int],
+    cache: _StyleCache,
+) -> None:
+    """Apply *new* to every cell, merging it onto any existing border.
+
+    A cell stores its border as an index into the workbook's border
+    registry (``cell._style.borderId``). Writing that index directly skips
+    the Border hashing the ``cell.border`` setter does on every assignment
+    while leaving the cell's other style fields untouched.
+
+    *merged* memoizes existing border index -> merged border index. A range
+    rarely holds more than a handful of distinct existing borders (usually
+    just the empty default), so each merge is computed once rather than once
+    per cell.
+    """
+    # Bound methods held in locals: these run once per cell.
+    lookup = merged.get
+    clone_blank = None
+    for cell in cells:
+        style = cell._style
+        if style is None:
+            # Never-styled cell: its border is the default at index 0, so it
+            # takes a copy of one prepared StyleArray with no lookups at all.
+            if clone_blank is None:
+                new_id = lookup(0)
+                if new_id is None:
+                    new_id = _add_merged(new, 0, merged, cache)
+                blank = StyleArray()
+                blank.borderId = new_id
+                clone_blank = blank.__copy__
+            cell._style = clone_blank()
+            continue
+        old_id = style.borderId
+        new_id = lookup(old_id)
+        if new_id is None:
+            new_id = _add_merged(new, old_id, merged, cache)
+        style.borderId = new_id
+
+
+def _add_merged(
+    new: Border, old_id: int, merged: dict[int, int], cache: _StyleCache,
+) -> int:
+    """Register *new* merged onto border *old_id* and memoize its index."""
+    registry = cache.registry
+    merged_border = _merge_border(cache, new, registry[old_id])
+    new_id = merged[old_id] = registry.add(merged_border)
+    return new_id
+
+
+def _range_rows(
+    ws: Worksheet, min_col: int, min_row: int, max_col: int, max_row: int,
+) -> Iterable[list[Cell]]:
+    """Yield the cells of each row in the range, creating missing ones.
+
+    Existing cells are read straight from ``ws._cells``; ``ws.cell`` (and its
+    coordinate checks) only runs for cells that do not exist yet. Read-only
+    and write-only worksheets, which cannot restyle cells, raise TypeError.
+    """
+    cells = getattr(ws, "_cells", None)
+    make = getattr(ws, "cell", None)
+    if cells is None or make is None:
+        raise TypeError(
+            f"cannot set borders on a {type(ws).__name__}; "
+            "read-only and write-only worksheets do not allow restyling cells"
+        )
+    get = cells.get
+    columns = range(min_col, max_col + 1)
+    for row in range(min_row, max_row + 1):
+        row_cells = [get((row, col)) for col in columns]
+        if None in row_cells:
+            row_cells = [
+                make(row=row, column=col) if cell is None else cell
+                for col, cell in zip(columns, row_cells)
+            ]
+        yield row_cells
+
+
+def _merge_memo(cache: _StyleCache, new: Border) -> dict[int, int]:
+    """Return the workbook's memo of merge results for *new* (see _stamp)."""
+    found = cache.memos.get(id(new))
+    if found is None or found[0] is not new:
+        found = cache.memos[id(new)] = (new, {})
+    return found[1]
+
+
+def _axis_masks(lo: int, hi: int, first: int, last: int) -> list[int]:
+    """Return the edge mask of each index from *lo* to *hi* along one axis."""
+    if lo == hi:
+        return [first | last]
+    return [first, *[0] * (hi - lo - 1), last]
+
+
+def _resolve_side(
+    cache: _StyleCache, spec: SideSpec, base_color: str | None,
+) -> Side | None:
     """Convert a SideSpec shorthand into a Side object.
 
     Returns None when *spec* is None (meaning "don't override").
@@ -53,35 +272,46 @@ def _resolve_side(spec: SideSpec, base_color: str | None) -> Side | None:
     if isinstance(spec, Side):
         return spec
     if isinstance(spec, str):
-        return Side(style=spec, color=base_color)
+        return _make_side(cache, spec, base_color)
     if isinstance(spec, tuple):
         style, color = spec
-        return Side(style=style, color=color)
+        return _make_side(cache, style, color)
     raise TypeError(f"Expected Side, str, tuple, or None; got {type(spec).__name__}")
 
 
+# Range strings repeat across calls (same layout on many sheets), so parse each
+# distinct string once.
+_range_boundaries = lru_cache(maxsize=1024)(range_boundaries)
+
+
 def _parse_range(cell_range: CellRange) -> tuple[int, int, int, int]:
-    """Convert a CellRange into (min_col, min_row, max_col, max_row)."""
-    if isinstance(cell_range, str):
-        return range_boundaries(cell_range)
-    if (
-        isinstance(cell_range, tuple)
-        and len(cell_range) == 2
-        and isinstance(cell_range[0], int)
-    ):
-        row, col = cell_range
-        return col, row, col, row
-    if (
-        isinstance(cell_range, tuple)
-        and len(cell_range) == 2
-        and isinstance(cell_range[0], tuple)
-    ):
-        (min_row, min_col), (max_row, max_col) = cell_range
-        return min_col, min_row, max_col, max_row
-    raise TypeError(
-        f"cell_range must be str, (row, col), or ((row, col), (row, col)); "
-        f"got {cell_range!r}"
-    )
+    """Convert a CellRange into (min_col, min_row, max_col, max_row).
+
+    Raises TypeError for an unsupported form and ValueError for bounds that
+    are open-ended (whole rows or columns such as ``"C:D"``) or below 1.
+    """
+    match cell_range:
+        case str():
+            bounds = _range_boundaries(cell_range)
+        # tuple(...) class patterns: bare sequence patterns would also match lists.
+        case tuple((int() as row, int() as col)):
+            bounds = col, row, col, row
+        case tuple((
+            tuple((int() as min_row, int() as min_col)),
+            tuple((int() as max_row, int() as max_col)),
+        )):
+            bounds = min_col, min_row, max_col, max_row
+        case _:
+            raise TypeError(
+                f"cell_range must be str, (row, col), or ((row, col), (row, col)); "
+                f"got {cell_range!r}"
+            )
+    if None in bounds or min(bounds) < 1:
+        raise ValueError(
+            f"cell_range must have row and column bounds of at least 1; "
+            f"got {cell_range!r}"
+        )
+    return bounds
 
 
 def set_border(
@@ -166,84 +396,337 @@ def set_border(
         ``style/color`` < ``custom`` < ``outline/inside`` <
         ``horizontal/vertical`` < individual sides.
     """
+    set_borders_bulk(
+        ws,
+        (cell_range,),
+        left=left, right=right, top=top, bottom=bottom,
+        inner_horizontal=inner_horizontal, inner_vertical=inner_vertical,
+        style=style, color=color, custom=custom,
+        outline=outline, inside=inside, horizontal=horizontal, vertical=vertical,
+    )
+
+
+def set_borders_bulk(
+    ws: Worksheet,
+    ranges: Iterable[CellRange],
+    *,
+    left: SideSpec = None,
+    right: SideSpec = None,
+    top: SideSpec = None,
+    bottom: SideSpec = None,
+    inner_horizontal: SideSpec = None,
+    inner_vertical: SideSpec = None,
+    style: str = "thin",
+    color: str | None = None,
+    custom: tuple[int, ...] | None = None,
+    outline: str | None = None,
+    inside: str | None = None,
+    horizontal: str | None = None,
+    vertical: str | None = None,
+) -> None:
+    """Apply the same borders to several ranges.
+
+    Equivalent to calling :func:`set_border` once per range with the same
+    keyword arguments, but the sides and the Border for each range position
+    are resolved once and shared by every range. All ranges are parsed and
+    checked before any cell is touched, so an invalid range leaves the sheet
+    as it was.
+
+    Examples::
+
+        # Thick underline on three separate header rows
+        set_borders_bulk(ws, ["A1:D1", "A5:D5", "A9:D9"], bottom="thick")
+
+        # Boxes around several blocks, no inner grid
+        set_borders_bulk(ws, ["A1:C3", "E1:G3"], custom=(2, 2, 2, 2))
+
+    Args:
+        ws: The openpyxl Worksheet to modify.
+        ranges: Target ranges, each in any form :func:`set_border` accepts.
+
+    All keyword arguments behave exactly as in :func:`set_border`.
+    """
+    cache = _style_cache(ws.parent)
+    sides = _resolve_sides(
+        cache,
+        left=left, right=right, top=top, bottom=bottom,
+        inner_horizontal=inner_horizontal, inner_vertical=inner_vertical,
+        style=style, color=color, custom=custom,
+        outline=outline, inside=inside, horizontal=horizontal, vertical=vertical,
+    )
+    if isinstance(ranges, str):
+        raise TypeError(
+            f"ranges must be an iterable of ranges, not a str; got {ranges!r} "
+            "(use set_border for a single range)"
+        )
+    bounds = [_parse_range(cell_range) for cell_range in ranges]
+    table: _PositionTable = [None] * 16
+    for b in bounds:
+        _apply_border(ws, b, sides, table, cache)
+
+
+def set_border_rows(
+    ws: Worksheet,
+    rows: Iterable[int],
+    columns: tuple[int, int],
+    *,
+    left: SideSpec = None,
+    right: SideSpec = None,
+    top: SideSpec = None,
+    bottom: SideSpec = None,
+    inner_horizontal: SideSpec = None,
+    inner_vertical: SideSpec = None,
+    style: str = "thin",
+    color: str | None = None,
+    custom: tuple[int, ...] | None = None,
+    outline: str | None = None,
+    inside: str | None = None,
+    horizontal: str | None = None,
+    vertical: str | None = None,
+) -> None:
+    """Apply the same borders to each of several rows, one row at a time.
+
+    Each row ``r`` is bordered as its own range
+    ``((r, min_col), (r, max_col))``, so every row gets its own top and
+    bottom edge. This is a shorthand for :func:`set_borders_bulk` over those
+    ranges.
+
+    Examples::
+
+        # Dashed underline on every other row of a table in columns A:E
+        set_border_rows(ws, range(2, 100, 2), (1, 5), bottom="dashed")
+
+    Args:
+        ws: The openpyxl Worksheet to modify.
+        rows: 1-based row numbers to border.
+        columns: ``(min_col, max_col)`` 1-based column span of each row.
+
+    All keyword arguments behave exactly as in :func:`set_border`.
+    """
+    min_col, max_col = columns
+    set_borders_bulk(
+        ws,
+        [((row, min_col), (row, max_col)) for row in rows],
+        left=left, right=right, top=top, bottom=bottom,
+        inner_horizontal=inner_horizontal, inner_vertical=inner_vertical,
+        style=style, color=color, custom=custom,
+        outline=outline, inside=inside, horizontal=horizontal, vertical=vertical,
+    )
+
+
+def _resolve_sides(
+    cache: _StyleCache,
+    *,
+    left: SideSpec = None,
+    right: SideSpec = None,
+    top: SideSpec = None,
+    bottom: SideSpec = None,
+    inner_horizontal: SideSpec = None,
+    inner_vertical: SideSpec = None,
+    style: str = "thin",
+    color: str | None = None,
+    custom: tuple[int, ...] | None = None,
+    outline: str | None = None,
+    inside: str | None = None,
+    horizontal: str | None = None,
+    vertical: str | None = None,
+) -> _Sides:
+    """Resolve the layered border params into the six final sides.
+
+    Returns ``(left, right, top, bottom, inner_horizontal, inner_vertical)``.
+    See :func:`set_border` for the layering rules.
+    """
+    # Full-control callers pass all six sides and no group params: Layers 1-4
+    # would be overwritten entirely, so resolve the explicit sides directly.
+    # The base Side is still resolved so an invalid style or color raises.
+    if (
+        custom is None
+        and outline is None
+        and inside is None
+        and horizontal is None
+        and vertical is None
+        and left is not None
+        and right is not None
+        and top is not None
+        and bottom is not None
+        and inner_horizontal is not None
+        and inner_vertical is not None
+    ):
+        _make_side(cache, style, color)
+        return (
+            _resolve_side(cache, left, base_color=color),
+            _resolve_side(cache, right, base_color=color),
+            _resolve_side(cache, top, base_color=color),
+            _resolve_side(cache, bottom, base_color=color),
+            _resolve_side(cache, inner_horizontal, base_color=color),
+            _resolve_side(cache, inner_vertical, base_color=color),
+        )
+
+    s_left, s_right, s_top, s_bottom, s_ih, s_iv = _resolve_layered_sides(
+        cache, style, color,
+        None if custom is None else tuple(custom),
+        outline, inside, horizontal, vertical,
+    )
+
+    # --- Layer 5: individual side params (highest priority) ---
+    if left is not None:
+        s_left = _resolve_side(cache, left, base_color=color)
+    if right is not None:
+        s_right = _resolve_side(cache, right, base_color=color)
+    if top is not None:
+        s_top = _resolve_side(cache, top, base_color=color)
+    if bottom is not None:
+        s_bottom = _resolve_side(cache, bottom, base_color=color)
+    if inner_horizontal is not None:
+        s_ih = _resolve_side(cache, inner_horizontal, base_color=color)
+    if inner_vertical is not None:
+        s_iv = _resolve_side(cache, inner_vertical, base_color=color)
+
+    return s_left, s_right, s_top, s_bottom, s_ih, s_iv
+
+
+def _resolve_layered_sides(
+    cache: _StyleCache,
+    style: str,
+    color: str | None,
+    custom: tuple[int, ...] | None,
+    outline: str | None,
+    inside: str | None,
+    horizontal: str | None,
+    vertical: str | None,
+) -> _Sides:
+    """Resolve Layers 1-4 (everything but the individual sides).
+
+    These params are all hashable, so the result is memoized per workbook:
+    code that formats many tables the same way resolves (and validates) them
+    once. Invalid params raise and are not memoized.
+    """
+    key = (style, color, custom, outline, inside, horizontal, vertical)
+    sides = cache.layers.get(key)
+    if sides is None:
+        sides = cache.layers[key] = _build_layered_sides(cache, *key)
+    return sides
+
+
+def _build_layered_sides(
+    cache: _StyleCache,
+    style: str,
+    color: str | None,
+    custom: tuple[int, ...] | None,
+    outline: str | None,
+    inside: str | None,
+    horizontal: str | None,
+    vertical: str | None,
+) -> _Sides:
+    """Build the Layer 1-4 sides; see :func:`_resolve_layered_sides`."""
     # --- Layer 1: base default (style + color) ---
-    sides: dict[str, Side] = {k: Side(style=style, color=color) for k in (
-        "left", "right", "top", "bottom", "inner_horizontal", "inner_vertical",
-    )}
+    # Resolved even when custom replaces it, so an invalid style or color
+    # still raises; the Side is interned, so this costs one lookup.
+    base = _make_side(cache, style, color)
 
     # --- Layer 2: custom tuple ---
-    if custom is not None:
+    # custom sets all six sides (a 4-tuple pads the inner ones with weight 0),
+    # so the Layer 1 default is only assigned when custom is absent.
+    if custom is None:
+        s_left = s_right = s_top = s_bottom = s_ih = s_iv = base
+    else:
         if len(custom) not in (4, 6):
             raise ValueError(
                 f"custom must have 4 or 6 elements, got {len(custom)}"
             )
-        for i, w in enumerate(custom):
-            if w not in WEIGHT_STYLES:
-                raise ValueError(
-                    f"custom[{i}] = {w!r} is not a valid weight "
-                    f"(expected one of {sorted(WEIGHT_STYLES)})"
-                )
+        if not _VALID_WEIGHTS.issuperset(custom):
+            i, w = next(
+                (i, w) for i, w in enumerate(custom) if w not in _VALID_WEIGHTS
+            )
+            raise ValueError(
+                f"custom[{i}] = {w!r} is not a valid weight "
+                f"(expected one of {_VALID_WEIGHTS_SORTED})"
+            )
         # Order: top, right, bottom, left, inner_horizontal, inner_vertical
         weights = custom + (0, 0) if len(custom) == 4 else custom
-        keys = ("top", "right", "bottom", "left", "inner_horizontal", "inner_vertical")
-        for k, w in zip(keys, weights):
-            sides[k] = Side(style=WEIGHT_STYLES[w], color=color)
+        w_top, w_right, w_bottom, w_left, w_ih, w_iv = weights
+        s_top = _make_side(cache, WEIGHT_STYLES[w_top], color)
+        s_right = _make_side(cache, WEIGHT_STYLES[w_right], color)
+        s_bottom = _make_side(cache, WEIGHT_STYLES[w_bottom], color)
+        s_left = _make_side(cache, WEIGHT_STYLES[w_left], color)
+        s_ih = _make_side(cache, WEIGHT_STYLES[w_ih], color)
+        s_iv = _make_side(cache, WEIGHT_STYLES[w_iv], color)
 
     # --- Layer 3: outline / inside ---
     if outline is not None:
-        outline_side = Side(style=outline, color=color)
-        for k in ("left", "right", "top", "bottom"):
-            sides[k] = outline_side
+        s_left = s_right = s_top = s_bottom = _make_side(cache, outline, color)
     if inside is not None:
-        inside_side = Side(style=inside, color=color)
-        for k in ("inner_horizontal", "inner_vertical"):
-            sides[k] = inside_side
+        s_ih = s_iv = _make_side(cache, inside, color)
 
     # --- Layer 4: horizontal / vertical ---
     if horizontal is not None:
-        h_side = Side(style=horizontal, color=color)
-        for k in ("top", "bottom", "inner_horizontal"):
-            sides[k] = h_side
+        s_top = s_bottom = s_ih = _make_side(cache, horizontal, color)
     if vertical is not None:
-        v_side = Side(style=vertical, color=color)
-        for k in ("left", "right", "inner_vertical"):
-            sides[k] = v_side
+        s_left = s_right = s_iv = _make_side(cache, vertical, color)
 
-    # --- Layer 5: individual side params (highest priority) ---
-    explicit: dict[str, SideSpec] = {
-        "left": left, "right": right, "top": top, "bottom": bottom,
-        "inner_horizontal": inner_horizontal, "inner_vertical": inner_vertical,
-    }
-    for k, v in explicit.items():
-        resolved = _resolve_side(v, base_color=color)
-        if resolved is not None:
-            sides[k] = resolved
-
-    s_left = sides["left"]
-    s_right = sides["right"]
-    s_top = sides["top"]
-    s_bottom = sides["bottom"]
-    s_ih = sides["inner_horizontal"]
-    s_iv = sides["inner_vertical"]
-
-    min_col, min_row, max_col, max_row = _parse_range(cell_range)
+    return s_left, s_right, s_top, s_bottom, s_ih, s_iv
+
+
+def _apply_border(
+    ws: Worksheet,
+    bounds: tuple[int, int, int, int],
+    sides: _Sides,
+    table: _PositionTable,
+    cache: _StyleCache,
+) -> None:
+    """Stamp *sides* onto the range *bounds* (min_col, min_row, max_col, max_row).
+
+    Every cell falls in one of at most 9 positions (4 corners, 4 edges,
+    interior), encoded as a bit mask of the range edges it touches. *table*
+    maps each mask to that position's Border and the workbook's memo of merge
+    results for it (see _stamp and _merge_memo); *cache* is the workbook's
+    :class:`_StyleCache`. Entries are filled on first
+    use, so ranges applied with the same *sides* can share one table.
+    """
+    min_col, min_row, max_col, max_row = bounds
+    s_left, s_right, s_top, s_bottom, s_ih, s_iv = sides
+    # Entry of the last position visited; see the uniform case below.
+    last_entry: _PositionEntry | None = None
+    row_masks = _axis_masks(min_row, max_row, _TOP, _BOTTOM)
+    col_masks = _axis_masks(min_col, max_col, _LEFT, _RIGHT)
+    # Past its second index an axis repeats 0 until the last mask, so the
+    # distinct masks are among the first two and the last.
+    for row_bits in {*row_masks[:2], row_masks[-1]}:
+        for col_bits in {*col_masks[:2], col_masks[-1]}:
+            pos = row_bits | col_bits
+            last_entry = table[pos]
+            if last_entry is None:
+                new = _border(
+                    cache,
+                    s_left if pos & _LEFT else s_iv,
+                    s_right if pos & _RIGHT else s_iv,
+                    s_top if pos & _TOP else s_ih,
+                    s_bottom if pos & _BOTTOM else s_ih,
+                )
+                last_entry = table[pos] = (new, _merge_memo(cache, new))
+
+    rows = _range_rows(ws, min_col, min_row, max_col, max_row)
+    if s_left is s_iv and s_right is s_iv and s_top is s_ih and s_bottom is s_ih:
+        # Outer and inner sides match (e.g. the all-thin default), so every
+        # position holds the same Border and any entry serves the whole
+        # range: stamp it as one run.
+        new, memo = cast(_PositionEntry, last_entry)
+        _stamp(chain.from_iterable(rows), new, memo, cache)
+        return
+
+    # Within a row only the first and last cells differ; every cell between
+    # them shares one Border, so it is stamped without per-cell dispatch.
+    # Every mask looked up below was filled in by the loop above.
+    for row_bits, row_cells in zip(row_masks, rows):
+        if min_col == max_col:
+            new, memo = cast(_PositionEntry, table[row_bits | _LEFT | _RIGHT])
+            _stamp(row_cells, new, memo, cache)
+            continue
+        new, memo = cast(_PositionEntry, table[row_bits | _LEFT])
+        _stamp(row_cells[:1], new, memo, cache)
+        if max_col - min_col > 1:
+            new, memo = cast(_PositionEntry, table[row_bits])
+            _stamp(row_cells[1:-1], new, memo, cache)
+        new, memo = cast(_PositionEntry, table[row_bits | _RIGHT])
+        _stamp(row_cells[-1:], new, memo, cache)
 
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = ws.cell(row=row, column=col)
-            existing = cell.border
-
-            cell.border = Border(
-                left=_merge_side(
-                    s_left if col == min_col else s_iv, existing.left,
-                ),
-                right=_merge_side(
-                    s_right if col == max_col else s_iv, existing.right,
-                ),
-                top=_merge_side(
-                    s_top if row == min_row else s_ih, existing.top,
-                ),
-                bottom=_merge_side(
-                    s_bottom if row == max_row else s_ih, existing.bottom,
-                ),
-            )